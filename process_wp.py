@@ -3,6 +3,7 @@ import numpy as np
 import datetime as dt
 import argparse
 import os
+from multiprocessing import Pool
 
 import read_wp
 from ncas_amof_netcdf_template import create_netcdf, util, remove_empty_variables
@@ -16,9 +17,10 @@ def get_data(trw_file):
 
 
 
-def make_netcdf_snr_winds(trw_files, metadata_file = None, ncfile_location = '.', verbose = True, options = ''):
+def make_netcdf_snr_winds(trw_files, metadata_file = None, ncfile_location = '.', verbose = True, options = '', processes = 1):
     """
     trw_files - list
+    processes - number of processes for reading trw files, files are read in parallel if > 1
     """
     if len(trw_files) == 0:
         msg = "No raw data files found!"
@@ -38,9 +40,19 @@ def make_netcdf_snr_winds(trw_files, metadata_file = None, ncfile_location = '.'
     all_time_coverage_end_dt = []
     all_file_date = []
 
-    for i in range(len(trw_files)):
-        if verbose: print(f'Reading {i+1} of {len(trw_files)} files')
-        data, attrs = get_data(trw_files[i])
+    # each trw file is read completely independently, so with more than one
+    # process the reads can be farmed out. Pool.map keeps the file order.
+    if processes > 1:
+        if verbose: print(f'Reading {len(trw_files)} files with {processes} processes')
+        with Pool(processes) as pool:
+            all_file_data = pool.map(get_data, trw_files)
+    else:
+        all_file_data = []
+        for i in range(len(trw_files)):
+            if verbose: print(f'Reading {i+1} of {len(trw_files)} files')
+            all_file_data.append(get_data(trw_files[i]))
+
+    for i, (data, attrs) in enumerate(all_file_data):
         this_unix_times, this_doy, this_years, this_months, this_days, this_hours, this_minutes, this_seconds, this_time_coverage_start_dt, this_time_coverage_end_dt, this_file_date = util.get_times([dt.datetime.fromtimestamp(data['time'], dt.timezone.utc)])
         all_unix_times.append(this_unix_times[0])
         all_doy.append(this_doy[0])
@@ -176,6 +188,7 @@ def main():
     parser.add_argument('-m','--metadata', type = str, help = 'csv file with global attributes and additional metadata. Default is None', dest='metadata')
     parser.add_argument('-o','--ncfile-location', type=str, help = 'Path for where to save netCDF file. Default is .', default = '.', dest="ncfile_location")
     parser.add_argument('-t','--options', type=str, help = 'Options allowed by standard in netCDF file name, e.g. "high-mode_15min".', default = '', dest="options")
+    parser.add_argument('-n','--processes', type=int, help = 'Number of processes for reading raw files in parallel. Default is 1.', default = 1, dest="processes")
     # there is only one data product at the moment - snr-winds - but this code will stay here commented out in case of future need
     #parser.add_argument('-p','--products', nargs = '*', help = 'Products of ncas-radar-wind-profiler-1 to make netCDF files for. Options are snr-winds. One or many can be given (space separated), default is "snr-winds".', default = ['snr-winds'])
     args = parser.parse_args()
@@ -192,7 +205,7 @@ def main():
             make_netcdf_snr_winds(args.input_file, metadata_file = args.metadata, ncfile_location = args.ncfile_location, verbose = args.verbose)
         print(f'WARNING: {prod} is not recognised for this instrument, continuing with other prodcuts...')
     '''
-    make_netcdf_snr_winds(args.input_file, metadata_file = args.metadata, ncfile_location = args.ncfile_location, verbose = args.verbose, options = options)
+    make_netcdf_snr_winds(args.input_file, metadata_file = args.metadata, ncfile_location = args.ncfile_location, verbose = args.verbose, options = options, processes = args.processes)
 
 
 if __name__ == "__main__":